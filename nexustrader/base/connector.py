@@ -436,6 +436,7 @@ class MockLinearConnector:
             else:
                 unrealized_pnl = float(position.amount) * (position.entry_price - book.mid)
             position.unrealized_pnl = unrealized_pnl
+            self._cache._mark_position_dirty(symbol)
     
     def _apply_fee(self, order: Order):
         """
@@ -444,6 +445,7 @@ class MockLinearConnector:
         self._cache._mem_account_balance[self._account_type]._update_free(
             order.fee_currency, -order.fee
         )
+        self._cache._mark_balance_dirty(self._account_type)
 
     def _apply_position(self, order: Order):
         """Update position for perpetual contract"""
@@ -489,6 +491,7 @@ class MockLinearConnector:
                 self._cache._mem_account_balance[self._account_type]._update_free(
                     market.quote, Decimal(str(realized_pnl))
                 )
+                self._cache._mark_balance_dirty(self._account_type)
 
             # Update position details
             if new_amount > Decimal('0'):
@@ -1,48 +1,294 @@
+from __future__ import annotations
+
 import os
 import sys
-from typing import Literal, Dict, List
-from enum import Enum
-from dynaconf import Dynaconf
+import pickle
+import hashlib
+import functools
+from types import MappingProxyType
+from array import array
+from typing import Literal, get_args
+from enum import Enum, IntEnum, StrEnum
 
 
 def is_sphinx_build():
-    return "sphinx" in sys.modules
+    return sys.modules.get("sphinx") is not None
+
+
+def _ensure_config_dir():
+    os.makedirs(".keys/", exist_ok=True)
+    if not os.path.exists(".keys/.secrets.toml") and not is_sphinx_build():
+        raise FileNotFoundError(
+            "Config file not found, please create a config file at .keys/.secrets.toml"
+        )
+
+
+SETTINGS_FILES = [".keys/settings.toml", ".keys/.secrets.toml"]
+SETTINGS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nexustrader")
+
+
+class _SettingsDict(dict):
+    """
+    Plain `dict` restored from the settings cache, with the case-insensitive
+    attribute and dotted-key access `Dynaconf` offers (e.g.
+    `settings.OKX.DEMO_1.api_key` or `settings.get("OKX.DEMO_1.API_KEY")`).
+    """
+
+    def _lookup(self, key):
+        try:
+            return self._lookup_key(key)
+        except KeyError:
+            if "." not in key:
+                raise
+        node = self
+        for part in key.split("."):
+            if not isinstance(node, _SettingsDict):
+                raise KeyError(key)
+            node = node._lookup_key(part)
+        return node
+
+    def _lookup_key(self, key):
+        for k in (key, key.upper(), key.lower()):
+            if dict.__contains__(self, k):
+                return dict.__getitem__(self, k)
+        lowered = key.lower()
+        for k in self:
+            if isinstance(k, str) and k.lower() == lowered:
+                return dict.__getitem__(self, k)
+        raise KeyError(key)
+
+    def __getattr__(self, name):
+        try:
+            return self._lookup(name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key):
+        return self._lookup(key) if isinstance(key, str) else dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def as_dict(self):
+        return dict(self)
+
+    @classmethod
+    def wrap(cls, value):
+        if isinstance(value, dict):
+            return cls({k: cls.wrap(v) for k, v in value.items()})
+        if isinstance(value, list):
+            return [cls.wrap(v) for v in value]
+        return value
+
+
+def _settings_cache_path() -> str:
+    """
+    Cache file for the resolved settings, keyed by `(path, mtime, size)` of
+    every source file plus the `NEXUS_` environment overrides.
+    """
+    key = []
+    for p in SETTINGS_FILES + [".env"]:
+        if os.path.exists(p):
+            st = os.stat(p)
+            key.append((os.path.abspath(p), st.st_mtime, st.st_size))
+    env = sorted((k, v) for k, v in os.environ.items() if k.startswith("NEXUS_"))
+    digest = hashlib.sha1(repr((key, env)).encode()).hexdigest()
+    return os.path.join(SETTINGS_CACHE_DIR, f"{_settings_cache_prefix()}{digest}.pkl")
+
+
+def _settings_cache_prefix() -> str:
+    """File name prefix shared by every cache of this directory's settings files"""
+    sources = [os.path.abspath(p) for p in SETTINGS_FILES + [".env"]]
+    return f"settings-{hashlib.sha1(repr(sources).encode()).hexdigest()[:16]}-"
+
+
+def _load_cached_settings(path: str):
+    try:
+        with open(path, "rb") as f:
+            return _SettingsDict.wrap(pickle.load(f))
+    except Exception:
+        return None
 
 
-if not os.path.exists(".keys/"):
-    os.makedirs(".keys/")
-if not os.path.exists(".keys/.secrets.toml") and not is_sphinx_build():
-    raise FileNotFoundError(
-        "Config file not found, please create a config file at .keys/.secrets.toml"
-    )
+def _dump_cached_settings(path: str, data: dict):
+    try:
+        os.makedirs(SETTINGS_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        # drop caches of older versions of the same settings files, they hold
+        # plaintext secrets; caches of other working directories are kept
+        keep = os.path.basename(path)
+        prefix = _settings_cache_prefix()
+        for name in os.listdir(SETTINGS_CACHE_DIR):
+            if name.startswith(prefix) and name.endswith(".pkl") and name != keep:
+                os.remove(os.path.join(SETTINGS_CACHE_DIR, name))
+    except Exception:
+        pass
+
+
+class _LazySettings:
+    """
+    Proxy that defers building the `Dynaconf` settings until first access.
+
+    On warm starts the resolved settings are restored from a pickle cache
+    instead of re-parsing the TOML files. The cache holds only the setting
+    values, so the first use of a name it cannot resolve, such as the
+    `Dynaconf` methods `exists`, `setenv` or `validators`, builds the real
+    `Dynaconf` object and serves everything from it afterwards.
+    """
+
+    def __init__(self):
+        self._inner = None
+
+    def _load(self):
+        if self._inner is None:
+            _ensure_config_dir()
+            cache_path = _settings_cache_path()
+            inner = _load_cached_settings(cache_path)
+            if inner is None:
+                inner = self._load_dynaconf()
+                _dump_cached_settings(cache_path, inner.as_dict())
+            self._inner = inner
+        return self._inner
+
+    def _load_dynaconf(self):
+        from dynaconf import Dynaconf
+
+        self._inner = Dynaconf(
+            envvar_prefix="NEXUS",
+            settings_files=SETTINGS_FILES,
+            load_dotenv=os.path.isfile(".env"),
+        )
+        return self._inner
+
+    def __getattr__(self, name):
+        inner = self._load()
+        try:
+            return getattr(inner, name)
+        except AttributeError:
+            if not isinstance(inner, _SettingsDict):
+                raise
+        return getattr(self._load_dynaconf(), name)
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    # dunder lookups bypass `__getattr__`, forward them explicitly
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+
+settings = _LazySettings()
+
+
+@functools.cache
+def _raw_secrets() -> dict:
+    """
+    Top-level keys of the settings files parsed directly with `tomllib`.
+    """
+    import tomllib
+
+    data = {}
+    for path in SETTINGS_FILES:
+        if os.path.isfile(path):
+            with open(path, "rb") as f:
+                data.update(tomllib.load(f))
+    return data
+
+
+def _redis_setting(name: str):
+    # env overrides (including ones from `.env`, which only Dynaconf loads)
+    # and anything not found in the raw files go through Dynaconf
+    if f"NEXUS_{name}" not in os.environ and not os.path.isfile(".env"):
+        try:
+            return _raw_secrets()[name]
+        except (OSError, ValueError, KeyError):
+            pass
+    return getattr(settings, name)
 
 
-settings = Dynaconf(
-    envvar_prefix="NEXUS",
-    settings_files=[".keys/settings.toml", ".keys/.secrets.toml"],
-    load_dotenv=True,
-)
+def get_redis_config(in_docker: bool = False):
+    """
+    Resolve the Redis connection params once per `in_docker` variant.
 
+    The result is a shared read-only mapping. Call
+    `get_redis_config.cache_clear()` to force a reload from settings.
+    """
+    # normalise first so every call form shares one cache entry
+    return _redis_config(bool(in_docker))
 
-def get_redis_config(in_docker: bool = False):
+
+@functools.lru_cache(maxsize=2)
+def _redis_config(in_docker: bool):
     try:
+        db = _redis_setting("REDIS_DB")
+        password = _redis_setting("REDIS_PASSWORD")
         if in_docker:
-            return {
-                "host": "redis",
-                "db": settings.REDIS_DB,
-                "password": settings.REDIS_PASSWORD,
+            return MappingProxyType(
+                {
+                    "host": "redis",
+                    "db": db,
+                    "password": password,
+                }
+            )
+
+        host = _redis_setting("REDIS_HOST")
+        port = _redis_setting("REDIS_PORT")
+        return MappingProxyType(
+            {
+                "host": host,
+                "port": port,
+                "db": db,
+                "password": password,
             }
-
-        return {
-            "host": settings.REDIS_HOST,
-            "port": settings.REDIS_PORT,
-            "db": settings.REDIS_DB,
-            "password": settings.REDIS_PASSWORD,
-        }
+        )
     except Exception as e:
         raise ValueError(f"Failed to get Redis password: {e}")
 
 
+get_redis_config.cache_clear = _redis_config.cache_clear
+
+
+def get_redis_pool(in_docker: bool = False):
+    """
+    Process-wide `redis.ConnectionPool` built from `get_redis_config`.
+
+    Use `redis.Redis(connection_pool=get_redis_pool())` instead of
+    `redis.Redis(**get_redis_config())` so clients share one pool.
+    """
+    return _redis_pool(bool(in_docker))
+
+
+@functools.cache
+def _redis_pool(in_docker: bool):
+    import redis
+
+    return redis.ConnectionPool(
+        **get_redis_config(in_docker),
+        max_connections=100,
+        health_check_interval=30,
+    )
+
+
 IntervalType = Literal[
     "1s",
     "1m",
@@ -62,6 +308,27 @@ IntervalType = Literal[
     "1M",
 ]
 
+VALID_INTERVALS: frozenset[str] = frozenset(get_args(IntervalType))
+
+INTERVAL_TO_SECONDS: dict[str, int] = {
+    "1s": 1,
+    "1m": 60,
+    "3m": 3 * 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "30m": 30 * 60,
+    "1h": 60 * 60,
+    "2h": 2 * 60 * 60,
+    "4h": 4 * 60 * 60,
+    "6h": 6 * 60 * 60,
+    "8h": 8 * 60 * 60,
+    "12h": 12 * 60 * 60,
+    "1d": 24 * 60 * 60,
+    "3d": 3 * 24 * 60 * 60,
+    "1w": 7 * 24 * 60 * 60,
+    "1M": 30 * 24 * 60 * 60,  # nominal 30-day month
+}
+
 class KlineInterval(Enum):
     SECOND_1 = "1s"
     MINUTE_1 = "1m"
@@ -81,7 +348,19 @@ class KlineInterval(Enum):
     MONTH_1 = "1M"
     
     
-class SubmitType(Enum):
+KLINE_INTERVAL_MAP: dict[str, KlineInterval] = {m.value: m for m in KlineInterval}
+
+_KLINE_SECONDS: dict[KlineInterval, int] = {
+    m: INTERVAL_TO_SECONDS[m.value] for m in KlineInterval
+}
+for _interval, _seconds in _KLINE_SECONDS.items():
+    _interval._seconds = _seconds
+
+# `kline_seconds(KlineInterval.MINUTE_1) -> 60`
+kline_seconds = _KLINE_SECONDS.__getitem__
+
+
+class SubmitType(IntEnum):
     CREATE = 0
     CANCEL = 1
     TWAP = 2
@@ -92,7 +371,7 @@ class SubmitType(Enum):
     TAKE_PROFIT = 7
 
 
-class EventType(Enum):
+class EventType(IntEnum):
     BOOKL1 = 0
     TRADE = 1
     KLINE = 2
@@ -109,7 +388,7 @@ class AlgoOrderStatus(Enum):
     FAILED = "FAILED"
 
 
-class OrderStatus(Enum):
+class OrderStatus(StrEnum):
     # LOCAL
     INITIALIZED = "INITIALIZED"
     FAILED = "FAILED"
@@ -129,13 +408,41 @@ class OrderStatus(Enum):
     EXPIRED = "EXPIRED"
 
 
-class ExchangeType(Enum):
+ORDER_STATUS_MAP: dict[str, OrderStatus] = {m.value: m for m in OrderStatus}
+
+
+def _enum_parser(enum_cls: type[Enum], members: dict):
+    """
+    Build a drop-in for `enum_cls(value)` that skips the `Enum.__call__`
+    dispatch and raises the same `ValueError` for unknown values.
+    """
+    get = members.get
+
+    def parse(value):
+        member = get(value)
+        if member is None:
+            raise ValueError(f"{value!r} is not a valid {enum_cls.__qualname__}")
+        return member
+
+    return parse
+
+
+to_order_status = _enum_parser(OrderStatus, ORDER_STATUS_MAP)
+
+
+class ExchangeType(StrEnum):
     BINANCE = "binance"
     OKX = "okx"
     BYBIT = "bybit"
     HYPERLIQUID = "hyperliquid"
 
 
+EXCHANGE_TYPE_MAP: dict[str, ExchangeType] = {m.value: m for m in ExchangeType}
+
+
+to_exchange_type = _enum_parser(ExchangeType, EXCHANGE_TYPE_MAP)
+
+
 class BinanceAccountType(Enum):
     SPOT = "SPOT"
     MARGIN = "MARGIN"
@@ -159,22 +466,28 @@ class OrderType(Enum):
     TAKE_PROFIT_LIMIT = "TAKE_PROFIT_LIMIT"
     STOP_LOSS_MARKET = "STOP_LOSS_MARKET"
     STOP_LOSS_LIMIT = "STOP_LOSS_LIMIT"
-    
-    @property
-    def is_take_profit(self) -> bool:
-        return self in (OrderType.TAKE_PROFIT_MARKET, OrderType.TAKE_PROFIT_LIMIT)
-    
-    @property
-    def is_stop_loss(self) -> bool:
-        return self in (OrderType.STOP_LOSS_MARKET, OrderType.STOP_LOSS_LIMIT)
-    
-    @property
-    def is_market(self) -> bool:
-        return self in (OrderType.MARKET, OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_LOSS_MARKET)
-    
-    @property
-    def is_limit(self) -> bool:
-        return self in (OrderType.LIMIT, OrderType.TAKE_PROFIT_LIMIT, OrderType.STOP_LOSS_LIMIT)
+
+    # precomputed per member below, so each check is a plain attribute load
+    is_take_profit: bool
+    is_stop_loss: bool
+    is_market: bool
+    is_limit: bool
+
+
+_TAKE_PROFIT_TYPES = frozenset({OrderType.TAKE_PROFIT_MARKET, OrderType.TAKE_PROFIT_LIMIT})
+_STOP_LOSS_TYPES = frozenset({OrderType.STOP_LOSS_MARKET, OrderType.STOP_LOSS_LIMIT})
+_MARKET_TYPES = frozenset(
+    {OrderType.MARKET, OrderType.TAKE_PROFIT_MARKET, OrderType.STOP_LOSS_MARKET}
+)
+_LIMIT_TYPES = frozenset(
+    {OrderType.LIMIT, OrderType.TAKE_PROFIT_LIMIT, OrderType.STOP_LOSS_LIMIT}
+)
+
+for _type in OrderType:
+    _type.is_take_profit = _type in _TAKE_PROFIT_TYPES
+    _type.is_stop_loss = _type in _STOP_LOSS_TYPES
+    _type.is_market = _type in _MARKET_TYPES
+    _type.is_limit = _type in _LIMIT_TYPES
 
 
 class TriggerType(Enum):
@@ -183,19 +496,26 @@ class TriggerType(Enum):
     INDEX_PRICE = "INDEX_PRICE"
 
 
-class OrderSide(Enum):
+class OrderSide(StrEnum):
     BUY = "BUY"
     SELL = "SELL"
-    
-    @property
-    def is_buy(self) -> bool:
-        return self == OrderSide.BUY
-    
-    @property
-    def is_sell(self) -> bool:
-        return self == OrderSide.SELL
 
-class TimeInForce(Enum):
+    is_buy: bool
+    is_sell: bool
+
+
+for _side in OrderSide:
+    _side.is_buy = _side is OrderSide.BUY
+    _side.is_sell = _side is OrderSide.SELL
+
+
+ORDER_SIDE_MAP: dict[str, OrderSide] = {m.value: m for m in OrderSide}
+
+
+to_order_side = _enum_parser(OrderSide, ORDER_SIDE_MAP)
+
+
+class TimeInForce(StrEnum):
     GTC = "GTC"
     IOC = "IOC"
     FOK = "FOK"
@@ -205,18 +525,16 @@ class PositionSide(Enum):
     LONG = "LONG"
     SHORT = "SHORT"
     FLAT = "FLAT"
-    
-    @property
-    def is_long(self) -> bool:
-        return self == PositionSide.LONG
-    
-    @property
-    def is_short(self) -> bool:
-        return self == PositionSide.SHORT
-    
-    @property
-    def is_flat(self) -> bool:
-        return self == PositionSide.FLAT
+
+    is_long: bool
+    is_short: bool
+    is_flat: bool
+
+
+for _side in PositionSide:
+    _side.is_long = _side is PositionSide.LONG
+    _side.is_short = _side is PositionSide.SHORT
+    _side.is_flat = _side is PositionSide.FLAT
 
 
 class InstrumentType(Enum):
@@ -234,44 +552,74 @@ class OptionType(Enum):
     PUT = "put"
 
 
-STATUS_TRANSITIONS: Dict[OrderStatus, List[OrderStatus]] = {
-    OrderStatus.PENDING: [
-        OrderStatus.CANCELED,
-        OrderStatus.CANCELING,
-        OrderStatus.ACCEPTED,
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.CANCELED,
-        OrderStatus.FILLED,
-        OrderStatus.CANCEL_FAILED,
-    ],
-    OrderStatus.CANCELING: [
-        OrderStatus.CANCELED,
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.FILLED,
-    ],
-    OrderStatus.ACCEPTED: [
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.FILLED,
-        OrderStatus.CANCELING,
-        OrderStatus.CANCELED,
-        OrderStatus.EXPIRED,
-        OrderStatus.CANCEL_FAILED,
-    ],
-    OrderStatus.PARTIALLY_FILLED: [
-        OrderStatus.PARTIALLY_FILLED,
-        OrderStatus.FILLED,
-        OrderStatus.CANCELING,
-        OrderStatus.CANCELED,
-        OrderStatus.EXPIRED,
-        OrderStatus.CANCEL_FAILED,
-    ],
-    OrderStatus.FILLED: [],
-    OrderStatus.CANCELED: [],
-    OrderStatus.EXPIRED: [],
-    OrderStatus.FAILED: [],
+STATUS_TRANSITIONS: dict[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.PENDING: frozenset(
+        {
+            OrderStatus.CANCELED,
+            OrderStatus.CANCELING,
+            OrderStatus.ACCEPTED,
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.FILLED,
+            OrderStatus.CANCEL_FAILED,
+        }
+    ),
+    OrderStatus.CANCELING: frozenset(
+        {
+            OrderStatus.CANCELED,
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.FILLED,
+        }
+    ),
+    OrderStatus.ACCEPTED: frozenset(
+        {
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.FILLED,
+            OrderStatus.CANCELING,
+            OrderStatus.CANCELED,
+            OrderStatus.EXPIRED,
+            OrderStatus.CANCEL_FAILED,
+        }
+    ),
+    OrderStatus.PARTIALLY_FILLED: frozenset(
+        {
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.FILLED,
+            OrderStatus.CANCELING,
+            OrderStatus.CANCELED,
+            OrderStatus.EXPIRED,
+            OrderStatus.CANCEL_FAILED,
+        }
+    ),
+    OrderStatus.FILLED: frozenset(),
+    OrderStatus.CANCELED: frozenset(),
+    OrderStatus.EXPIRED: frozenset(),
+    OrderStatus.FAILED: frozenset(),
 }
 
 
+for _i, _status in enumerate(OrderStatus):
+    _status._ord = _i
+
+# dense transition table: bit `nxt._ord` of row `cur._ord` is set if allowed
+_TRANS_TABLE = array("Q", bytes(8 * len(OrderStatus)))
+for _cur, _allowed in STATUS_TRANSITIONS.items():
+    for _nxt in _allowed:
+        _TRANS_TABLE[_cur._ord] |= 1 << _nxt._ord
+
+
+def can_transition(cur: OrderStatus, nxt: OrderStatus) -> bool:
+    """
+    Check whether an order may move from status `cur` to status `nxt`.
+    """
+    return bool(_TRANS_TABLE[cur._ord] & (1 << nxt._ord))
+
+
+# specialized validators for call sites that know the source status, e.g.
+# `can_transition_from_pending(OrderStatus.FILLED)`
+for _cur, _allowed in STATUS_TRANSITIONS.items():
+    globals()[f"can_transition_from_{_cur.name.lower()}"] = _allowed.__contains__
+
+
 class DataType(Enum):
     BOOKL1 = "bookl1"
     BOOKL2 = "bookl2"
@@ -3,11 +3,15 @@ import asyncio
 import aiosqlite
 import sqlite3
 import re
-from decimal import Decimal
-from typing import Dict, Set, Type, List, Optional
+import heapq
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Set, Type, List, Optional, Tuple
 from collections import defaultdict
 from returns.maybe import maybe
 from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 from nexustrader.schema import (
     Order,
@@ -21,13 +25,65 @@ from nexustrader.schema import (
     AccountBalance,
     Balance,
 )
-from nexustrader.constants import STATUS_TRANSITIONS, AccountType, KlineInterval
+from nexustrader.constants import AccountType, KlineInterval, can_transition
 from nexustrader.core.entity import TaskManager, RedisClient
 from nexustrader.core.log import SpdLog
 from nexustrader.core.registry import OrderRegistry
 from nexustrader.core.nautilius_core import LiveClock, MessageBus
 from nexustrader.constants import StorageBackend
 
+# WAL lets readers run alongside the periodic sync writer, and NORMAL sync
+# only fsyncs at checkpoints, which is safe in WAL mode
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA wal_autocheckpoint=1000;
+    PRAGMA busy_timeout=5000;
+"""
+
+REDIS_PIPELINE_FLUSH_SIZE = 1000
+
+# rows encoded per executemany call on the SQLite sync path
+SQLITE_EXECUTEMANY_CHUNK = 1000
+
+# errors one bad row raises every time it is encoded or bound, retrying the
+# batch cannot fix them so the row is dropped instead
+SQLITE_ROW_ERRORS = (
+    msgspec.EncodeError,
+    sqlite3.InterfaceError,
+    sqlite3.ProgrammingError,
+    OverflowError,
+    TypeError,
+    ValueError,
+    AttributeError,
+)
+
+# upper bound in seconds for the SQLite writer's retry backoff
+SQLITE_WRITER_MAX_BACKOFF = 60
+
+# leading format byte on every stored BLOB, so the encoding can change later
+BLOB_FORMAT_MSGPACK = b"\x01"
+
+# order amounts are stored as integers in units of 1e-8; the BLOB keeps the exact Decimal
+AMOUNT_SCALE = Decimal("1e8")
+# SQLite INTEGER is a signed 64-bit value, larger amounts are stored as NULL
+SQLITE_INT_MIN, SQLITE_INT_MAX = -(2**63), 2**63 - 1
+
+
+class _KeyPrefixes(dict):
+    """`{base}{value}:` Redis key prefixes, formatted once per value"""
+
+    def __init__(self, base: str):
+        super().__init__()
+        self._base = base
+
+    def __missing__(self, value: str) -> str:
+        prefix = self[value] = f"{self._base}{value}:"
+        return prefix
+
 
 class AsyncCache:
     def __init__(
@@ -41,6 +97,7 @@ class AsyncCache:
         db_path: str = ".keys/cache.db",
         sync_interval: int = 60,  # seconds
         expired_time: int = 3600,  # seconds
+        flush_interval: float = 1,  # seconds, sqlite writer
     ):
         parent_dir = Path(db_path).parent
         if not parent_dir.exists():
@@ -70,16 +127,40 @@ class AsyncCache:
             set
         )  # symbol -> set(uuid)
         self._mem_positions: Dict[str, Position] = {}  # symbol -> Position
+        self._mem_positions_by_exchange: Dict[ExchangeType, Dict[str, Position]] = (
+            defaultdict(dict)
+        )  # exchange_id -> symbol -> Position, same objects as _mem_positions
         self._mem_account_balance: Dict[AccountType, AccountBalance] = defaultdict(
             AccountBalance
         )
 
+        # uuids changed since the last sync, only these are re-encoded and written
+        self._dirty_orders: Set[str] = set()
+        self._dirty_algo_orders: Set[str] = set()
+        self._dirty_open_orders: Set[str] = set()  # uuids opened or closed
+        self._dirty_positions: Set[str] = set()  # symbols
+        self._deleted_position_symbols: Set[str] = set()
+        self._dirty_balances: Set[AccountType] = set()
+        # (account_type, asset) -> (free, locked) as last written to SQLite
+        self._synced_balances: Dict[Tuple[AccountType, str], Tuple[Decimal, Decimal]] = {}
+        # written in the open transaction, moved to _synced_balances once it commits
+        self._pending_balances: Dict[Tuple[AccountType, str], Tuple[Decimal, Decimal]] = {}
+        # the first SQLite sync reconciles against rows left by a previous run
+        self._positions_reconciled = False
+        self._open_orders_reconciled = False
+        # (timestamp, uuid) min-heaps, cleanup only looks at the expired prefix
+        self._order_expiry: List[Tuple[int, str]] = []
+        self._algo_order_expiry: List[Tuple[int, str]] = []
+
         # set params
         self._sync_interval = sync_interval  # sync interval
+        self._flush_interval = flush_interval  # sqlite writer interval
         self._expired_time = expired_time  # expire time
         self._task_manager = task_manager
 
-        self._kline_cache: Dict[str, Kline] = {}
+        self._instrument_ids: Dict[str, InstrumentId] = {}  # symbol -> InstrumentId
+
+        self._kline_cache: Dict[str, Dict[KlineInterval, Kline]] = defaultdict(dict)
         self._bookl1_cache: Dict[str, BookL1] = {}
         self._trade_cache: Dict[str, Trade] = {}
 
@@ -89,9 +170,17 @@ class AsyncCache:
         self._msgbus.subscribe(topic="trade", handler=self._update_trade_cache)
 
         self._storage_initialized = False
+        self._sqlite_lock = asyncio.Lock()
         self._registry = registry
         
         self._table_prefix = self.safe_table_name(f"{self.strategy_id}_{self.user_id}")
+        self._sql = self._build_sql(self._table_prefix)
+        self._keys = self._build_redis_keys(f"strategy:{strategy_id}:user_id:{user_id}")
+        self._msgpack_encoder = msgspec.msgpack.Encoder()
+        self._msgpack_decoders: Dict[type, msgspec.msgpack.Decoder] = {
+            obj_type: msgspec.msgpack.Decoder(obj_type)
+            for obj_type in (Order, AlgoOrder, Position, Balance)
+        }
 
     ################# # base functions ####################
     
@@ -101,13 +190,111 @@ class AsyncCache:
         return name.lower()
 
     def _encode(self, obj: Order | Position | AlgoOrder) -> bytes:
-        return msgspec.json.encode(obj)
+        return BLOB_FORMAT_MSGPACK + self._msgpack_encoder.encode(obj)
 
     def _decode(
         self, data: bytes, obj_type: Type[Order | Position | AlgoOrder]
     ) -> Order | Position | AlgoOrder:
+        if data[:1] == BLOB_FORMAT_MSGPACK:
+            return self._msgpack_decoders[obj_type].decode(memoryview(data)[1:])
+        # blobs written before the msgpack switch are plain JSON
         return msgspec.json.decode(data, type=obj_type)
 
+    def _open_read_db(self, db_path: str):
+        self._db_read = sqlite3.connect(db_path)
+        self._db_read.executescript(SQLITE_PRAGMAS)
+
+    def _read(self, sql: str, params: tuple = ()) -> list:
+        """Run a read query on the reader thread and return all rows"""
+        return self._db_executor.submit(
+            lambda: self._db_read.execute(sql, params).fetchall()
+        ).result()
+
+    @staticmethod
+    def _build_sql(prefix: str) -> SimpleNamespace:
+        """SQL for the sync and read paths, formatted once for this table prefix"""
+        return SimpleNamespace(
+            insert_pnl=f"INSERT INTO {prefix}_pnl (timestamp, pnl, unrealized_pnl) VALUES (?, ?, ?)",
+            upsert_order=(
+                f"INSERT OR REPLACE INTO {prefix}_orders "
+                "(timestamp, uuid, symbol, side, type, amount_scaled, price, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+            ),
+            upsert_order_blob=(
+                f"INSERT OR REPLACE INTO {prefix}_orders_blob "
+                "(uuid, data) VALUES (?, ?)"
+            ),
+            upsert_algo_order=(
+                f"INSERT OR REPLACE INTO {prefix}_algo_orders "
+                "(timestamp, uuid, symbol, data) VALUES (?, ?, ?, ?)"
+            ),
+            select_position_symbols=f"SELECT symbol FROM {prefix}_positions",
+            delete_position=f"DELETE FROM {prefix}_positions WHERE symbol = ?",
+            upsert_position=(
+                f"INSERT OR REPLACE INTO {prefix}_positions "
+                "(symbol, exchange, side, amount, data) VALUES (?, ?, ?, ?, ?)"
+            ),
+            select_open_order_uuids=f"SELECT uuid FROM {prefix}_open_orders",
+            delete_open_order=f"DELETE FROM {prefix}_open_orders WHERE uuid = ?",
+            upsert_open_order=(
+                f"INSERT OR REPLACE INTO {prefix}_open_orders "
+                "(uuid, exchange, symbol) VALUES (?, ?, ?)"
+            ),
+            select_positions=f"SELECT symbol, data FROM {prefix}_positions WHERE exchange = ?",
+            select_balances=(
+                f"SELECT asset, free, locked FROM {prefix}_balances WHERE account_type = ?"
+            ),
+            select_order_blob=f"SELECT data FROM {prefix}_orders_blob WHERE uuid = ?",
+            select_algo_order_blob=f"SELECT data FROM {prefix}_algo_orders WHERE uuid = ?",
+            select_symbol_order_uuids=f"SELECT uuid FROM {prefix}_orders WHERE symbol = ?",
+            upsert_balance=(
+                f"INSERT OR REPLACE INTO {prefix}_balances "
+                "(asset, account_type, free, locked) VALUES (?, ?, ?, ?)"
+            ),
+        )
+
+    @staticmethod
+    def _build_redis_keys(base: str) -> SimpleNamespace:
+        """Redis keys for this strategy and user, per-exchange prefixes are filled lazily"""
+        return SimpleNamespace(
+            orders=f"{base}:orders",
+            algo_orders=f"{base}:algo_orders",
+            exchange=_KeyPrefixes(f"{base}:exchange:"),
+            account_type=_KeyPrefixes(f"{base}:account_type:"),
+        )
+
+    @contextmanager
+    def _requeue_on_error(self):
+        """Put drained dirty keys back if the write that consumed them fails"""
+        dirty_sets = (
+            self._dirty_orders,
+            self._dirty_algo_orders,
+            self._dirty_open_orders,
+            self._dirty_positions,
+            self._deleted_position_symbols,
+            self._dirty_balances,
+        )
+        snapshot = [set(dirty) for dirty in dirty_sets]
+        reconciled = (self._positions_reconciled, self._open_orders_reconciled)
+        try:
+            yield
+        except BaseException:
+            for dirty, keys in zip(dirty_sets, snapshot):
+                dirty |= keys
+            self._positions_reconciled, self._open_orders_reconciled = reconciled
+            raise
+
+    def _instrument_id(self, symbol: str) -> InstrumentId:
+        if (instrument_id := self._instrument_ids.get(symbol)) is None:
+            instrument_id = self._instrument_ids[symbol] = InstrumentId.from_str(symbol)
+        return instrument_id
+
+    @staticmethod
+    def _drain(dirty: Set[str]) -> List[str]:
+        keys = list(dirty)
+        dirty.clear()
+        return keys
+
     async def _init_storage(self):
         """Initialize the storage backend"""
         if self._storage_backend == StorageBackend.REDIS:
@@ -117,7 +304,12 @@ class AsyncCache:
             db_path = Path(self._db_path)
             db_path.parent.mkdir(parents=True, exist_ok=True)
             self._db_async = await aiosqlite.connect(str(db_path))
-            self._db = sqlite3.connect(str(db_path))
+            await self._db_async.executescript(SQLITE_PRAGMAS)
+            # sync readers run on one dedicated thread that owns its connection
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sqlite-read"
+            )
+            self._db_executor.submit(self._open_read_db, str(db_path)).result()
             await self._init_sqlite_tables()
         self._storage_initialized = True
 
@@ -132,15 +324,19 @@ class AsyncCache:
                     symbol TEXT,
                     side TEXT, 
                     type TEXT,
-                    amount TEXT,
+                    amount_scaled INTEGER,
                     price REAL,
-                    status TEXT,
-                    data BLOB
+                    status TEXT
                 );
                 
                 CREATE INDEX IF NOT EXISTS idx_orders_symbol 
                 ON {self._table_prefix}_orders(symbol);
                 
+                CREATE TABLE IF NOT EXISTS {self._table_prefix}_orders_blob (
+                    uuid TEXT PRIMARY KEY,
+                    data BLOB
+                );
+                
                 CREATE TABLE IF NOT EXISTS {self._table_prefix}_algo_orders (
                     timestamp INTEGER,
                     uuid TEXT PRIMARY KEY,
@@ -179,76 +375,215 @@ class AsyncCache:
                     unrealized_pnl REAL
                 );
             """)
+            await cursor.execute(f"PRAGMA table_info({self._table_prefix}_orders)")
+            columns = {row[1] for row in await cursor.fetchall()}
+            await self._migrate_order_blobs(cursor, columns)
+            await self._migrate_order_amount(cursor, columns)
             await self._db_async.commit()
+
+    async def _migrate_order_blobs(self, cursor: aiosqlite.Cursor, columns: Set[str]):
+        """Move BLOBs from the old single-table orders layout into `_orders_blob`"""
+        if "data" not in columns:
+            return
+        await cursor.execute(
+            f"INSERT OR IGNORE INTO {self._table_prefix}_orders_blob (uuid, data) "
+            f"SELECT uuid, data FROM {self._table_prefix}_orders WHERE data IS NOT NULL"
+        )
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            # once the column is gone later startups skip this migration entirely
+            await cursor.execute(f"ALTER TABLE {self._table_prefix}_orders DROP COLUMN data")
+        else:
+            await cursor.execute(
+                f"UPDATE {self._table_prefix}_orders SET data = NULL WHERE data IS NOT NULL"
+            )
     
+    async def _migrate_order_amount(self, cursor: aiosqlite.Cursor, columns: Set[str]):
+        """Convert the old TEXT `amount` column into `amount_scaled` integers"""
+        if "amount_scaled" in columns:
+            return
+        await cursor.execute(
+            f"ALTER TABLE {self._table_prefix}_orders ADD COLUMN amount_scaled INTEGER"
+        )
+        if "amount" not in columns:
+            return
+        await cursor.execute(
+            f"SELECT uuid, amount FROM {self._table_prefix}_orders "
+            "WHERE amount IS NOT NULL AND amount != 'None'"
+        )
+        rows = await cursor.fetchall()
+        await cursor.executemany(
+            f"UPDATE {self._table_prefix}_orders SET amount_scaled = ?, amount = NULL WHERE uuid = ?",
+            # amounts that do not fit keep their TEXT copy
+            [
+                (scaled, uuid)
+                for uuid, amount in rows
+                if (scaled := self._scale_amount(amount)) is not None
+            ],
+        )
+
+    @staticmethod
+    def _scale_amount(amount: Decimal | float | str | None) -> int | None:
+        if amount is None:
+            return None
+        # amounts are not always Decimal, e.g. a float passed to create_order
+        try:
+            scaled = int(Decimal(str(amount)) * AMOUNT_SCALE)
+        except (InvalidOperation, ValueError, OverflowError):
+            return None
+        if not SQLITE_INT_MIN <= scaled <= SQLITE_INT_MAX:
+            return None
+        return scaled
+
     async def _sync_pnl(self, timestamp: int, pnl: float, unrealized_pnl: float):
-        async with self._db_async.cursor() as cursor:
-            await cursor.execute(f"INSERT INTO {self._table_prefix}_pnl (timestamp, pnl, unrealized_pnl) VALUES (?, ?, ?)", (timestamp, pnl, unrealized_pnl))
-            await self._db_async.commit()
+        # shares the connection with the writer, never commit half of its batch
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            try:
+                await cursor.execute(self._sql.insert_pnl, (timestamp, pnl, unrealized_pnl))
+                await self._db_async.commit()
+            except Exception:
+                await self._db_async.rollback()
+                raise
 
     async def start(self):
         """Start the cache"""
         await self._init_storage()
         self._task_manager.create_task(self._periodic_sync())
+        if self._storage_backend == StorageBackend.SQLITE:
+            self._task_manager.create_task(self._sqlite_writer())
 
     async def _periodic_sync(self):
         """Periodically sync the cache"""
         while True:
             if self._storage_backend == StorageBackend.REDIS:
                 await self._sync_to_redis()
-            elif self._storage_backend == StorageBackend.SQLITE:
-                await self._sync_to_sqlite()
             self._cleanup_expired_data()
             await asyncio.sleep(self._sync_interval)
 
+    def _has_dirty(self) -> bool:
+        return bool(
+            self._dirty_orders
+            or self._dirty_algo_orders
+            or self._dirty_open_orders
+            or self._dirty_positions
+            or self._deleted_position_symbols
+            or self._dirty_balances
+        )
+
+    async def _sqlite_writer(self):
+        """Flush changed entries to SQLite in one short transaction per tick"""
+        delay = self._flush_interval
+        while True:
+            if self._has_dirty():
+                try:
+                    await self._sync_to_sqlite()
+                    delay = self._flush_interval
+                except Exception as e:
+                    # keep the writer alive, the dirty keys were requeued
+                    delay = min(delay * 2, SQLITE_WRITER_MAX_BACKOFF)
+                    self._log.error(f"Error syncing to SQLite, retrying in {delay}s: {e}")
+            await asyncio.sleep(delay)
+
     async def _sync_to_redis(self):
         """Sync the cache to Redis"""
         self._log.debug("syncing to redis")
-        for uuid, order in self._mem_orders.copy().items():
-            orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
-            await self._r_async.hset(orders_key, uuid, self._encode(order))
-
-        for uuid, algo_order in self._mem_algo_orders.copy().items():
-            algo_orders_key = (
-                f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
-            )
-            await self._r_async.hset(algo_orders_key, uuid, self._encode(algo_order))
+        with self._requeue_on_error():
+            await self._write_to_redis()
+
+    async def _write_to_redis(self):
+        # only the SQLite backend consumes this, Redis rewrites the open order sets below
+        self._dirty_open_orders.clear()
+        pipe = self._r_async.pipeline(transaction=False)
+
+        async def maybe_flush():
+            # bound the buffered commands for very large dumps
+            if len(pipe) >= REDIS_PIPELINE_FLUSH_SIZE:
+                await pipe.execute()
+
+        orders = {
+            uuid: self._encode(order)
+            for uuid in self._drain(self._dirty_orders)
+            if (order := self._mem_orders.get(uuid)) is not None
+        }
+        if orders:
+            pipe.hset(self._keys.orders, mapping=orders)
 
-        for exchange, open_order_uuids in self._mem_open_orders.copy().items():
-            open_orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange.value}:open_orders"
+        algo_orders = {
+            uuid: self._encode(algo_order)
+            for uuid in self._drain(self._dirty_algo_orders)
+            if (algo_order := self._mem_algo_orders.get(uuid)) is not None
+        }
+        if algo_orders:
+            pipe.hset(self._keys.algo_orders, mapping=algo_orders)
 
-            await self._r_async.delete(open_orders_key)
+        for exchange, open_order_uuids in list(self._mem_open_orders.items()):
+            open_orders_key = self._keys.exchange[exchange.value] + "open_orders"
 
+            pipe.delete(open_orders_key)
             if open_order_uuids:
-                await self._r_async.sadd(open_orders_key, *open_order_uuids)
+                pipe.sadd(open_orders_key, *open_order_uuids)
+            await maybe_flush()
 
-        for symbol, uuids in self._mem_symbol_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{symbol}"
-            await self._r_async.delete(key)
+        for symbol, uuids in list(self._mem_symbol_orders.items()):
+            instrument_id = self._instrument_id(symbol)
+            key = f"{self._keys.exchange[instrument_id.exchange.value]}symbol_orders:{symbol}"
+            pipe.delete(key)
             if uuids:
-                await self._r_async.sadd(key, *uuids)
+                pipe.sadd(key, *uuids)
+            await maybe_flush()
 
-        for symbol, uuids in self._mem_symbol_open_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_open_orders:{symbol}"
-            await self._r_async.delete(key)
+        for symbol, uuids in list(self._mem_symbol_open_orders.items()):
+            instrument_id = self._instrument_id(symbol)
+            key = f"{self._keys.exchange[instrument_id.exchange.value]}symbol_open_orders:{symbol}"
+            pipe.delete(key)
             if uuids:
-                await self._r_async.sadd(key, *uuids)
+                pipe.sadd(key, *uuids)
+            await maybe_flush()
+
+        # remove closed positions so they drop out of the index
+        for symbol in self._drain(self._deleted_position_symbols):
+            prefix = self._keys.exchange[self._instrument_id(symbol).exchange.value]
+            pipe.delete(f"{prefix}symbol_positions:{symbol}")
+            pipe.srem(prefix + "position_index", symbol)
+            await maybe_flush()
 
         # Add position sync
-        for symbol, position in self._mem_positions.copy().items():
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{position.exchange.value}:symbol_positions:{symbol}"
-            await self._r_async.set(key, self._encode(position))
+        for symbol in self._drain(self._dirty_positions):
+            position = self._mem_positions.get(symbol)
+            if position is None:
+                continue
+            prefix = self._keys.exchange[position.exchange.value]
+            key = f"{prefix}symbol_positions:{symbol}"
+            index_key = prefix + "position_index"
+            pipe.set(key, self._encode(position))
+            pipe.sadd(index_key, symbol)
+            await maybe_flush()
             
         # Add balance sync
-        for account_type, balance in self._mem_account_balance.copy().items():
-            for asset, amount in balance.balances.items():
-                key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:account_type:{account_type.value}:asset_balance:{asset}"
-                await self._r_async.set(key, self._encode(amount))
+        for account_type in self._drain(self._dirty_balances):
+            balance = self._mem_account_balance[account_type]
+            prefix = self._keys.account_type[account_type.value]
+            index_key = prefix + "balance_index"
+            for asset, amount in list(balance.balances.items()):
+                key = f"{prefix}asset_balance:{asset}"
+                pipe.set(key, self._encode(amount))
+                pipe.sadd(index_key, asset)
+                await maybe_flush()
+
+        await pipe.execute()
 
     async def _sync_to_sqlite(self):
         """Sync the cache to SQLite"""
+        async with self._sqlite_lock:
+            with self._requeue_on_error():
+                try:
+                    await self._write_to_sqlite()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
+
+    async def _write_to_sqlite(self):
+        if not self._db_async.in_transaction:
+            await self._db_async.execute("BEGIN IMMEDIATE")
         async with self._db_async.cursor() as cursor:
             await self._sync_orders(cursor)
             await self._sync_algo_orders(cursor)
@@ -256,159 +591,300 @@ class AsyncCache:
             await self._sync_open_orders(cursor)
             await self._sync_balances(cursor)
             await self._db_async.commit()
+        self._confirm_synced_balances()
     
     async def sync_orders(self):
-        async with self._db_async.cursor() as cursor:
-            await self._sync_orders(cursor)
-            await self._db_async.commit()
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            with self._requeue_on_error():
+                try:
+                    await self._sync_orders(cursor)
+                    await self._db_async.commit()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
     
     async def sync_algo_orders(self):
-        async with self._db_async.cursor() as cursor:
-            await self._sync_algo_orders(cursor)
-            await self._db_async.commit()
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            with self._requeue_on_error():
+                try:
+                    await self._sync_algo_orders(cursor)
+                    await self._db_async.commit()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
 
     async def sync_positions(self):
-        async with self._db_async.cursor() as cursor:
-            await self._sync_positions(cursor)
-            await self._db_async.commit()
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            with self._requeue_on_error():
+                try:
+                    await self._sync_positions(cursor)
+                    await self._db_async.commit()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
             
     async def sync_open_orders(self):
-        async with self._db_async.cursor() as cursor:
-            await self._sync_open_orders(cursor)
-            await self._db_async.commit()
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            with self._requeue_on_error():
+                try:
+                    await self._sync_open_orders(cursor)
+                    await self._db_async.commit()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
             
     async def sync_balances(self):
-        async with self._db_async.cursor() as cursor:
-            await self._sync_balances(cursor)
-            await self._db_async.commit()
+        async with self._sqlite_lock, self._db_async.cursor() as cursor:
+            with self._requeue_on_error():
+                try:
+                    await self._sync_balances(cursor)
+                    await self._db_async.commit()
+                    self._confirm_synced_balances()
+                except Exception:
+                    await self._db_async.rollback()
+                    raise
             
+    def _rows(self, items, make_row) -> list:
+        """Build SQLite rows, dropping items that cannot be encoded"""
+        rows = []
+        for key, obj in items:
+            try:
+                rows.append(make_row(key, obj))
+            except SQLITE_ROW_ERRORS as e:
+                self._log.error(f"Dropping {key} from SQLite sync: {e}")
+        return rows
+
+    async def _executemany(self, cursor: aiosqlite.Cursor, sql: str, rows: list):
+        """executemany, retried row by row so one unbindable row does not fail the batch"""
+        try:
+            await cursor.executemany(sql, rows)
+        except SQLITE_ROW_ERRORS:
+            for row in rows:
+                try:
+                    await cursor.execute(sql, row)
+                except SQLITE_ROW_ERRORS as e:
+                    fields = [v for v in row if not isinstance(v, bytes)]
+                    self._log.error(f"Dropping row {fields} from SQLite sync: {e}")
+
+    @staticmethod
+    def _chunks(items: List, size: int = SQLITE_EXECUTEMANY_CHUNK):
+        for i in range(0, len(items), size):
+            yield items[i : i + size]
+
     async def _sync_orders(self, cursor: aiosqlite.Cursor):
         """Sync orders to SQLite"""
-        for uuid, order in self._mem_orders.copy().items():
-            await cursor.execute(
-                f"INSERT OR REPLACE INTO {self._table_prefix}_orders "
-                "(timestamp, uuid, symbol, side, type, amount, price, status, data) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    order.timestamp,
-                    uuid,
-                    order.symbol,
-                    order.side.value,
-                    order.type.value,
-                    str(order.amount),  # sqlite does not support decimal
-                    order.price or order.average,
-                    order.status.value,
-                    self._encode(order),
+        uuids = self._drain(self._dirty_orders)
+        # encode one chunk at a time so only a chunk of BLOBs is alive at once
+        for chunk in self._chunks(uuids):
+            orders = [
+                (uuid, order)
+                for uuid in chunk
+                if (order := self._mem_orders.get(uuid)) is not None
+            ]
+            rows = self._rows(
+                orders,
+                lambda uuid, order: (
+                    (
+                        order.timestamp,
+                        uuid,
+                        order.symbol,
+                        order.side.value,
+                        order.type.value,
+                        self._scale_amount(order.amount),
+                        order.price or order.average,
+                        order.status.value,
+                    ),
+                    (uuid, self._encode(order)),
                 ),
             )
+            await self._executemany(
+                cursor, self._sql.upsert_order, [row for row, _ in rows]
+            )
+            await self._executemany(
+                cursor, self._sql.upsert_order_blob, [blob for _, blob in rows]
+            )
 
     async def _sync_algo_orders(self, cursor: aiosqlite.Cursor):
         """Sync algorithmic orders to SQLite"""
-        for uuid, algo_order in self._mem_algo_orders.copy().items():
-            await cursor.execute(
-                f"INSERT OR REPLACE INTO {self._table_prefix}_algo_orders "
-                "(timestamp, uuid, symbol, data) VALUES (?, ?, ?, ?)",
-                (
+        uuids = self._drain(self._dirty_algo_orders)
+        for chunk in self._chunks(uuids):
+            rows = self._rows(
+                [
+                    (uuid, algo_order)
+                    for uuid in chunk
+                    if (algo_order := self._mem_algo_orders.get(uuid)) is not None
+                ],
+                lambda uuid, algo_order: (
                     algo_order.timestamp,
                     uuid,
                     algo_order.symbol,
                     self._encode(algo_order),
                 ),
             )
+            await self._executemany(cursor, self._sql.upsert_algo_order, rows)
 
     async def _sync_positions(self, cursor: aiosqlite.Cursor):
         """Sync positions to SQLite
         
         1. Delete positions that no longer exist in memory
-        2. Insert or update current positions
+        2. Insert or update positions changed since the last sync
         """
-        # First get all positions from database
-        await cursor.execute(f"SELECT symbol FROM {self._table_prefix}_positions")
-        db_positions = {row[0] for row in await cursor.fetchall()}
-        
-        # Delete positions that are in DB but not in memory
-        positions_to_delete = db_positions - set(self.get_all_positions().keys())
+        if not self._positions_reconciled:
+            # First get all positions from database
+            await cursor.execute(self._sql.select_position_symbols)
+            db_positions = {row[0] for row in await cursor.fetchall()}
+            # Delete positions that are in DB but not in memory
+            positions_to_delete = {
+                symbol
+                for symbol in db_positions
+                if (position := self._mem_positions.get(symbol)) is None
+                or not position.is_opened
+            }
+            self._deleted_position_symbols.clear()
+            self._positions_reconciled = True
+        else:
+            positions_to_delete = set(self._drain(self._deleted_position_symbols))
+
         if positions_to_delete:
             await cursor.executemany(
-                f"DELETE FROM {self._table_prefix}_positions WHERE symbol = ?",
+                self._sql.delete_position,
                 [(symbol,) for symbol in positions_to_delete]
             )
             self._log.debug(f"Deleted {len(positions_to_delete)} stale positions from database")
 
-        # Insert or update current positions
-        for symbol, position in self._mem_positions.copy().items():
-            await cursor.execute(
-                f"INSERT OR REPLACE INTO {self._table_prefix}_positions "
-                "(symbol, exchange, side, amount, data) VALUES (?, ?, ?, ?, ?)",
-                (
-                    symbol,
-                    position.exchange.value,
-                    position.side.value if position.side else "FLAT",
-                    str(position.amount),
-                    self._encode(position),
-                ),
-            )
+        # Insert or update changed positions
+        rows = self._rows(
+            [
+                (symbol, position)
+                for symbol in self._drain(self._dirty_positions)
+                if (position := self._mem_positions.get(symbol)) is not None
+            ],
+            lambda symbol, position: (
+                symbol,
+                position.exchange.value,
+                position.side.value if position.side else "FLAT",
+                str(position.amount),
+                self._encode(position),
+            ),
+        )
+        await self._executemany(cursor, self._sql.upsert_position, rows)
 
     async def _sync_open_orders(self, cursor: aiosqlite.Cursor):
         """Sync open orders to SQLite"""
-        await cursor.execute(f"DELETE FROM {self._table_prefix}_open_orders")
-        
-        for exchange, uuids in self._mem_open_orders.copy().items():
-            for uuid in uuids:
+        if not self._open_orders_reconciled:
+            # diff against the table instead of rewriting it
+            await cursor.execute(self._sql.select_open_order_uuids)
+            db_uuids = {row[0] for row in await cursor.fetchall()}
+            mem_uuids = {uuid for uuids in self._mem_open_orders.values() for uuid in uuids}
+            self._dirty_open_orders.clear()
+            self._open_orders_reconciled = True
+            uuids = list(mem_uuids - db_uuids)
+            to_delete = [(uuid,) for uuid in db_uuids - mem_uuids]
+        else:
+            uuids = []
+            to_delete = []
+            for uuid in self._drain(self._dirty_open_orders):
                 order = self._mem_orders.get(uuid)
-                if order:
-                    await cursor.execute(
-                        f"INSERT INTO {self._table_prefix}_open_orders "
-                        "(uuid, exchange, symbol) VALUES (?, ?, ?)",
-                        (uuid, exchange.value, order.symbol),
-                    )
+                if order and uuid in self._mem_open_orders[order.exchange]:
+                    uuids.append(uuid)
+                else:
+                    to_delete.append((uuid,))
+
+        await cursor.executemany(
+            self._sql.delete_open_order,
+            to_delete,
+        )
+        rows = [
+            (uuid, order.exchange.value, order.symbol)
+            for uuid in uuids
+            if (order := self._mem_orders.get(uuid)) is not None
+        ]
+        await cursor.executemany(
+            self._sql.upsert_open_order,
+            rows,
+        )
 
     async def _sync_balances(self, cursor):
         """Sync account balances to SQLite"""
-        for account_type, balance in self._mem_account_balance.copy().items():
-            for asset, amount in balance.balances.items():
-                await cursor.execute(
-                    f"INSERT OR REPLACE INTO {self._table_prefix}_balances "
-                    "(asset, account_type, free, locked) VALUES (?, ?, ?, ?)",
+        rows = []
+        self._pending_balances.clear()
+        for account_type in self._drain(self._dirty_balances):
+            for asset, amount in self._mem_account_balance[account_type].balances.items():
+                # a dirty account usually has only a few assets that actually moved
+                values = (amount.free, amount.locked)
+                if self._synced_balances.get((account_type, asset)) == values:
+                    continue
+                self._pending_balances[(account_type, asset)] = values
+                rows.append(
                     (
                         asset,
                         account_type.value,
                         str(amount.free),
                         str(amount.locked),
-                    ),
+                    )
                 )
+        await cursor.executemany(
+            self._sql.upsert_balance,
+            rows,
+        )
+
+    def _confirm_synced_balances(self):
+        self._synced_balances.update(self._pending_balances)
+        self._pending_balances.clear()
 
     def _cleanup_expired_data(self):
         """Cleanup expired data"""
         current_time = self._clock.timestamp_ms()
         expire_before = current_time - self._expired_time * 1000
 
-        expired_orders = []
-        for uuid, order in self._mem_orders.copy().items():
-            if order.timestamp < expire_before:
-                expired_orders.append(uuid)
-
-                if not order.is_closed:
-                    self._log.warn(f"order {uuid} is not closed, but expired")
-
-                self._registry.remove_order(order)
-
+        expired_orders = self._pop_expired(
+            self._order_expiry, self._mem_orders, expire_before
+        )
         for uuid in expired_orders:
-            del self._mem_orders[uuid]
+            order = self._mem_orders.pop(uuid)
+            if not order.is_closed:
+                self._log.warn(f"order {uuid} is not closed, but expired")
+            self._registry.remove_order(order)
             self._mem_closed_orders.pop(uuid, None)
-            self._log.debug(f"removing order {uuid} from memory")
-            for symbol, order_set in self._mem_symbol_orders.copy().items():
-                self._log.debug(f"removing order {uuid} from symbol {symbol}")
+            symbol, exchange = order.symbol, order.exchange
+            if order_set := self._mem_symbol_orders.get(symbol):
                 order_set.discard(uuid)
+            if order_set := self._mem_symbol_open_orders.get(symbol):
+                order_set.discard(uuid)
+            if order_set := self._mem_open_orders.get(exchange):
+                if uuid in order_set:
+                    order_set.discard(uuid)
+                    self._dirty_open_orders.add(uuid)
 
-        expired_algo_orders = [
-            uuid
-            for uuid, algo_order in self._mem_algo_orders.copy().items()
-            if algo_order.timestamp < expire_before
-        ]
+        expired_algo_orders = self._pop_expired(
+            self._algo_order_expiry, self._mem_algo_orders, expire_before
+        )
         for uuid in expired_algo_orders:
             del self._mem_algo_orders[uuid]
-            self._log.debug(f"removing algo order {uuid} from memory")
+
+        if expired_orders or expired_algo_orders:
+            self._log.debug(
+                f"removed {len(expired_orders)} orders, {len(expired_algo_orders)} algo orders from memory"
+            )
+
+    @staticmethod
+    def _pop_expired(
+        expiry: List[Tuple[int, str]],
+        orders: Dict[str, Order | AlgoOrder],
+        expire_before: int,
+    ) -> List[str]:
+        """Pop uuids whose current timestamp is older than `expire_before`"""
+        expired = []
+        while expiry and expiry[0][0] < expire_before:
+            _, uuid = heapq.heappop(expiry)
+            if (order := orders.get(uuid)) is None:
+                continue
+            if order.timestamp < expire_before:
+                expired.append(uuid)
+            else:
+                # the order was updated after it was queued, requeue it
+                heapq.heappush(expiry, (order.timestamp, uuid))
+        return expired
 
     async def close(self):
         """关闭缓存"""
@@ -419,13 +895,13 @@ class AsyncCache:
             elif self._storage_backend == StorageBackend.SQLITE:
                 await self._sync_to_sqlite()
                 await self._db_async.close()
-                self._db.close()
+                self._db_executor.submit(self._db_read.close).result()
+                self._db_executor.shutdown()
 
     ################ # cache public data  ###################
 
     def _update_kline_cache(self, kline: Kline):
-        key = f"{kline.symbol}-{kline.interval.value}"
-        self._kline_cache[key] = kline
+        self._kline_cache[kline.symbol][kline.interval] = kline
 
     def _update_bookl1_cache(self, bookl1: BookL1):
         self._bookl1_cache[bookl1.symbol] = bookl1
@@ -440,8 +916,9 @@ class AsyncCache:
         :param symbol: The symbol of the Kline to retrieve.
         :return: The Kline object if found, otherwise None.
         """
-        key = f"{symbol}-{interval.value}"
-        return self._kline_cache.get(key, None)
+        if klines := self._kline_cache.get(symbol):
+            return klines.get(interval)
+        return None
 
     def bookl1(self, symbol: str) -> Optional[BookL1]:
         """
@@ -468,7 +945,7 @@ class AsyncCache:
         if not previous_order:
             return True
 
-        if order.status not in STATUS_TRANSITIONS[previous_order.status]:
+        if not can_transition(previous_order.status, order.status):
             self._log.debug(
                 f"Order id: {order.uuid} Invalid status transition: {previous_order.status} -> {order.status}"
             )
@@ -479,11 +956,26 @@ class AsyncCache:
     def _apply_position(self, position: Position):
         if position.is_closed:
             self._mem_positions.pop(position.symbol, None)
+            self._mem_positions_by_exchange[position.exchange].pop(position.symbol, None)
+            self._dirty_positions.discard(position.symbol)
+            self._deleted_position_symbols.add(position.symbol)
         else:
             self._mem_positions[position.symbol] = position
+            self._mem_positions_by_exchange[position.exchange][position.symbol] = position
+            self._dirty_positions.add(position.symbol)
+            self._deleted_position_symbols.discard(position.symbol)
+
+    def _mark_position_dirty(self, symbol: str):
+        """Queue a position that was updated in place for the next sync"""
+        self._dirty_positions.add(symbol)
+
+    def _mark_balance_dirty(self, account_type: AccountType):
+        """Queue an account balance that was updated in place for the next sync"""
+        self._dirty_balances.add(account_type)
 
     def _apply_balance(self, account_type: AccountType, balances: List[Balance]):
         self._mem_account_balance[account_type]._apply(balances)
+        self._dirty_balances.add(account_type)
 
     def get_balance(self, account_type: AccountType) -> AccountBalance:
         return self._mem_account_balance[account_type]
@@ -494,51 +986,79 @@ class AsyncCache:
             return position
 
     def get_all_positions(self, exchange: Optional[ExchangeType] = None) -> Dict[str, Position]:
+        if exchange is None:
+            source = self._mem_positions
+        else:
+            source = self._mem_positions_by_exchange.get(exchange, {})
         positions = {
             symbol: position
-            for symbol, position in self._mem_positions.copy().items()
-            if ((exchange is None or position.exchange == exchange) and position.is_opened)
+            for symbol, position in source.items()
+            if position.is_opened
         }
         return positions
 
     def _order_initialized(self, order: Order | AlgoOrder):
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                heapq.heappush(self._algo_order_expiry, (order.timestamp, order.uuid))
             self._mem_algo_orders[order.uuid] = order
+            self._dirty_algo_orders.add(order.uuid)
         else:
             if not self._check_status_transition(order):
                 return
+            if order.uuid not in self._mem_orders:
+                heapq.heappush(self._order_expiry, (order.timestamp, order.uuid))
             self._mem_orders[order.uuid] = order
+            self._dirty_orders.add(order.uuid)
+            self._dirty_open_orders.add(order.uuid)
             self._mem_open_orders[order.exchange].add(order.uuid)
             self._mem_symbol_orders[order.symbol].add(order.uuid)
             self._mem_symbol_open_orders[order.symbol].add(order.uuid)
 
     def _order_status_update(self, order: Order | AlgoOrder):
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                heapq.heappush(self._algo_order_expiry, (order.timestamp, order.uuid))
             self._mem_algo_orders[order.uuid] = order
+            self._dirty_algo_orders.add(order.uuid)
         else:
             if not self._check_status_transition(order):
                 return
+            if order.uuid not in self._mem_orders:
+                heapq.heappush(self._order_expiry, (order.timestamp, order.uuid))
             self._mem_orders[order.uuid] = order
+            self._dirty_orders.add(order.uuid)
             if order.is_closed:
+                self._dirty_open_orders.add(order.uuid)
                 self._mem_open_orders[order.exchange].discard(order.uuid)
                 self._mem_symbol_open_orders[order.symbol].discard(order.uuid)
                 
 
+    def _get_indexed_values_from_redis(self, prefix: str, index_key: str) -> List[bytes]:
+        """Fetch every `{prefix}{member}` value listed in the `index_key` set in one round trip"""
+        if members := self._r.smembers(index_key):
+            keys = [f"{prefix}{member.decode()}" for member in members]
+        else:
+            # data written before the index existed, SCAN does not block the server
+            keys = list(self._r.scan_iter(match=f"{prefix}*", count=1000))
+        if not keys:
+            return []
+        return [raw for raw in self._r.mget(keys) if raw]
+
     def _get_all_positions_from_redis(self, exchange_id: ExchangeType) -> Dict[str, Position]:
         positions = {}
-        pattern = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange_id.value}:symbol_positions:*"
-        keys = self._r.keys(pattern)
-        for key in keys:
-            if raw_position := self._r.get(key):
-                position = self._decode(raw_position, Position)
-                positions[position.symbol] = position
+        prefix = self._keys.exchange[exchange_id.value]
+        for raw_position in self._get_indexed_values_from_redis(
+            f"{prefix}symbol_positions:", f"{prefix}position_index"
+        ):
+            position = self._decode(raw_position, Position)
+            positions[position.symbol] = position
         return positions
     
     def _get_all_positions_from_sqlite(self, exchange_id: ExchangeType) -> Dict[str, Position]:
         positions = {}
-        cursor = self._db.cursor()
-        cursor.execute(f"SELECT symbol, data FROM {self._table_prefix}_positions WHERE exchange = ?", (exchange_id.value,))
-        for row in cursor.fetchall():
+        rows = self._read(self._sql.select_positions, (exchange_id.value,))
+        for row in rows:
             position = self._decode(row[1], Position)
             if position.side:
                 positions[position.symbol] = position
@@ -546,20 +1066,19 @@ class AsyncCache:
     
     def _get_balance_from_sqlite(self, account_type: AccountType) -> List[Balance]:
         balances = []
-        cursor = self._db.cursor()
-        cursor.execute(f"SELECT asset, free, locked FROM {self._table_prefix}_balances WHERE account_type = ?", (account_type.value,))
-        for row in cursor.fetchall():
+        rows = self._read(self._sql.select_balances, (account_type.value,))
+        for row in rows:
             balances.append(Balance(asset=row[0], free=Decimal(row[1]), locked=Decimal(row[2])))
         return balances
     
     def _get_balance_from_redis(self, account_type: AccountType) -> List[Balance]:
         balances = []
-        pattern = f"strategy:{self.strategy_id}:user_id:{self.user_id}:account_type:{account_type.value}:asset_balance:*"
-        keys = self._r.keys(pattern)
-        for key in keys:
-            if raw_balance := self._r.get(key):
-                balance: Balance = self._decode(raw_balance, Balance)
-                balances.append(balance)
+        prefix = self._keys.account_type[account_type.value]
+        for raw_balance in self._get_indexed_values_from_redis(
+            f"{prefix}asset_balance:", f"{prefix}balance_index"
+        ):
+            balance: Balance = self._decode(raw_balance, Balance)
+            balances.append(balance)
         return balances
     
     #NOTE: this function is not for user to call, it is for internal use
@@ -581,51 +1100,50 @@ class AsyncCache:
         if uuid.startswith("ALGO-"):
             if order := self._mem_algo_orders.get(uuid):
                 return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
+            key = self._keys.algo_orders
             obj_type = AlgoOrder
             mem_dict = self._mem_algo_orders
+            expiry = self._algo_order_expiry
         else:
             if order := self._mem_orders.get(uuid):
                 return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
+            key = self._keys.orders
             obj_type = Order
             mem_dict = self._mem_orders
+            expiry = self._order_expiry
 
         if raw_order := self._r.hget(key, uuid):
             order = self._decode(raw_order, obj_type)
             mem_dict[uuid] = order
+            heapq.heappush(expiry, (order.timestamp, uuid))
             return order
         return None
 
     def _get_order_from_sqlite(self, uuid: str) -> Optional[Order | AlgoOrder]:
         try:
-            # determine the table and object type to query
+            # determine the query and object type
             if uuid.startswith("ALGO-"):
-                table = f"{self._table_prefix}_algo_orders"
+                sql = self._sql.select_algo_order_blob
                 obj_type = AlgoOrder
                 mem_dict = self._mem_algo_orders
+                expiry = self._algo_order_expiry
             else:
-                table = f"{self._table_prefix}_orders"
+                sql = self._sql.select_order_blob
                 obj_type = Order
                 mem_dict = self._mem_orders
+                expiry = self._order_expiry
 
             # find in memory
             if order := mem_dict.get(uuid):
                 return order
 
             # query SQLite
-            cursor = self._db.cursor()
-            cursor.execute(
-                f"""
-                SELECT data FROM {table}
-                WHERE uuid = ?
-                """,
-                (uuid,),
-            )
+            rows = self._read(sql, (uuid,))
 
-            if row := cursor.fetchone():
-                order = self._decode(row[0], obj_type)
+            if rows:
+                order = self._decode(rows[0][0], obj_type)
                 mem_dict[uuid] = order  # Cache in memory
+                heapq.heappush(expiry, (order.timestamp, uuid))
                 return order
 
             return None
@@ -642,26 +1160,20 @@ class AsyncCache:
             return self._get_order_from_sqlite(uuid)
 
     def _get_symbol_orders_from_redis(self, instrument_id: InstrumentId) -> Set[str]:
-        key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{instrument_id.symbol}"
+        key = f"{self._keys.exchange[instrument_id.exchange.value]}symbol_orders:{instrument_id.symbol}"
         if redis_orders := self._r.smembers(key):
             return {uuid.decode() for uuid in redis_orders}
         return set()
 
     def _get_symbol_orders_from_sqlite(self, instrument_id: InstrumentId) -> Set[str]:
-        cursor = self._db.cursor()
-        cursor.execute(
-            f"""
-            SELECT uuid FROM {self._table_prefix}_orders WHERE symbol = ?
-            """,
-            (instrument_id.symbol,),
-        )
-        return {row[0] for row in cursor.fetchall()}
+        rows = self._read(self._sql.select_symbol_order_uuids, (instrument_id.symbol,))
+        return {row[0] for row in rows}
 
     def get_symbol_orders(self, symbol: str, in_mem: bool = True) -> Set[str]:
         """Get all orders for a symbol from memory and Redis"""
         memory_orders = self._mem_symbol_orders.get(symbol, set())
         if not in_mem:
-            instrument_id = InstrumentId.from_str(symbol)
+            instrument_id = self._instrument_id(symbol)
             if self._storage_backend == StorageBackend.REDIS:
                 orders = self._get_symbol_orders_from_redis(instrument_id)
             elif self._storage_backend == StorageBackend.SQLITE:
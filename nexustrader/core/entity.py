@@ -4,12 +4,13 @@ import socket
 from typing import Callable
 from typing import Dict, List
 import warnings
+from collections import deque
 
 import redis
 import time
 
 from dataclasses import dataclass
-from nexustrader.constants import get_redis_config
+from nexustrader.constants import get_redis_config, get_redis_pool
 from nexustrader.core.log import SpdLog
 from nexustrader.core.nautilius_core import LiveClock
 from nexustrader.schema import Kline, BookL1, Trade
@@ -106,14 +107,17 @@ class TaskManager:
 
 class RedisClient:
     _params = None
+    _in_docker = None
 
     @classmethod
     def _is_in_docker(cls) -> bool:
-        try:
-            socket.gethostbyname("redis")
-            return True
-        except socket.gaierror:
-            return False
+        if cls._in_docker is None:
+            try:
+                socket.gethostbyname("redis")
+                cls._in_docker = True
+            except socket.gaierror:
+                cls._in_docker = False
+        return cls._in_docker
 
     @classmethod
     def _get_params(cls) -> dict:
@@ -124,13 +128,99 @@ class RedisClient:
 
     @classmethod
     def get_client(cls) -> redis.Redis:
-        return redis.Redis(**cls._get_params())
+        return redis.Redis(connection_pool=get_redis_pool(cls._is_in_docker()))
 
     @classmethod
     def get_async_client(cls) -> redis.asyncio.Redis:
         return redis.asyncio.Redis(**cls._get_params())
 
 
+class RedisBatcher:
+    """
+    Coalesce Redis commands into non-transactional pipeline flushes.
+
+    A batch is flushed once `max_batch` commands are pending or `max_delay_ms`
+    has passed since the first pending command, whichever comes first. A batch
+    that fails is put back at the front and retried after `retry_delay_ms`.
+    """
+
+    def __init__(
+        self,
+        client: redis.asyncio.Redis,
+        task_manager: TaskManager,
+        max_batch: int = 128,
+        max_delay_ms: float = 5,
+        retry_delay_ms: float = 1000,
+    ):
+        self._client = client
+        self._task_manager = task_manager
+        self._max_batch = max_batch
+        self._max_delay = max_delay_ms / 1000
+        self._retry_delay = retry_delay_ms / 1000
+        self._pending: deque[tuple] = deque()
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+
+    def submit(self, *args):
+        """Queue a raw command, e.g. `submit("SET", key, value)`."""
+        self._pending.append(args)
+        if len(self._pending) == 1:
+            self._wakeup.set()
+        if len(self._pending) >= self._max_batch:
+            self._full.set()
+
+    async def flush(self):
+        while self._pending:
+            n = min(len(self._pending), self._max_batch)
+            batch = [self._pending.popleft() for _ in range(n)]
+            try:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for args in batch:
+                        pipe.execute_command(*args)
+                    await pipe.execute()
+            except BaseException:
+                self._pending.extendleft(reversed(batch))
+                raise
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            try:
+                await asyncio.wait_for(self._full.wait(), self._max_delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            self._full.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                self._log.error(
+                    f"Error flushing redis batch, {len(self._pending)} commands pending: {e}"
+                )
+                await asyncio.sleep(self._retry_delay)
+            if self._pending:
+                # submit only wakes the loop on an empty queue
+                self._wakeup.set()
+                if len(self._pending) >= self._max_batch:
+                    self._full.set()
+
+    def start(self):
+        self._task = self._task_manager.create_task(self._run())
+
+    async def close(self):
+        """Stop the flush loop and flush every command still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
 class Clock:
     def __init__(self, tick_size: float = 1.0):
         """
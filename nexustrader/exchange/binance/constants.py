@@ -204,52 +204,43 @@ class BinanceAccountType(AccountType):
 
     @property
     def is_spot(self):
-        return self in (self.SPOT, self.SPOT_TESTNET)
+        return self._is_spot
 
     @property
     def is_margin(self):
-        return self in (self.MARGIN,)
+        return self._is_margin
 
     @property
     def is_isolated_margin(self):
-        return self in (self.ISOLATED_MARGIN,)
+        return self._is_isolated_margin
 
     @property
     def is_isolated_margin_or_margin(self):
-        return self in (self.MARGIN, self.ISOLATED_MARGIN)
+        return self._is_isolated_margin_or_margin
 
     @property
     def is_spot_or_margin(self):
-        return self in (self.SPOT, self.MARGIN, self.ISOLATED_MARGIN, self.SPOT_TESTNET)
+        return self._is_spot_or_margin
 
     @property
     def is_future(self):
-        return self in (
-            self.USD_M_FUTURE,
-            self.COIN_M_FUTURE,
-            self.USD_M_FUTURE_TESTNET,
-            self.COIN_M_FUTURE_TESTNET,
-        )
+        return self._is_future
 
     @property
     def is_linear(self):
-        return self in (self.USD_M_FUTURE, self.USD_M_FUTURE_TESTNET)
+        return self._is_linear
 
     @property
     def is_inverse(self):
-        return self in (self.COIN_M_FUTURE, self.COIN_M_FUTURE_TESTNET)
+        return self._is_inverse
 
     @property
     def is_portfolio_margin(self):
-        return self in (self.PORTFOLIO_MARGIN,)
+        return self._is_portfolio_margin
 
     @property
     def is_testnet(self):
-        return self in (
-            self.SPOT_TESTNET,
-            self.USD_M_FUTURE_TESTNET,
-            self.COIN_M_FUTURE_TESTNET,
-        )
+        return self._is_testnet
 
     @property
     def base_url(self):
@@ -261,19 +252,71 @@ class BinanceAccountType(AccountType):
     
     @property
     def is_mock(self):
-        return self in (self.LINEAR_MOCK, self.INVERSE_MOCK, self.SPOT_MOCK)
+        return self._is_mock
     
     @property
     def is_linear_mock(self):
-        return self == self.LINEAR_MOCK
+        return self is BinanceAccountType.LINEAR_MOCK
     
     @property
     def is_inverse_mock(self):
-        return self == self.INVERSE_MOCK
+        return self is BinanceAccountType.INVERSE_MOCK
     
     @property
     def is_spot_mock(self):
-        return self == self.SPOT_MOCK
+        return self is BinanceAccountType.SPOT_MOCK
+
+
+_SPOT = frozenset({BinanceAccountType.SPOT, BinanceAccountType.SPOT_TESTNET})
+_MARGIN = frozenset({BinanceAccountType.MARGIN, BinanceAccountType.ISOLATED_MARGIN})
+_FUTURES = frozenset(
+    {
+        BinanceAccountType.USD_M_FUTURE,
+        BinanceAccountType.COIN_M_FUTURE,
+        BinanceAccountType.USD_M_FUTURE_TESTNET,
+        BinanceAccountType.COIN_M_FUTURE_TESTNET,
+    }
+)
+_TESTNET = frozenset(
+    {
+        BinanceAccountType.SPOT_TESTNET,
+        BinanceAccountType.USD_M_FUTURE_TESTNET,
+        BinanceAccountType.COIN_M_FUTURE_TESTNET,
+    }
+)
+_MOCK = frozenset(
+    {
+        BinanceAccountType.LINEAR_MOCK,
+        BinanceAccountType.INVERSE_MOCK,
+        BinanceAccountType.SPOT_MOCK,
+    }
+)
+
+# cache the predicates on each member so the properties are a single attribute load
+for _account_type in BinanceAccountType:
+    _account_type._is_spot = _account_type in _SPOT
+    _account_type._is_margin = _account_type is BinanceAccountType.MARGIN
+    _account_type._is_isolated_margin = (
+        _account_type is BinanceAccountType.ISOLATED_MARGIN
+    )
+    _account_type._is_isolated_margin_or_margin = _account_type in _MARGIN
+    _account_type._is_spot_or_margin = (
+        _account_type in _SPOT or _account_type in _MARGIN
+    )
+    _account_type._is_future = _account_type in _FUTURES
+    _account_type._is_linear = _account_type in (
+        BinanceAccountType.USD_M_FUTURE,
+        BinanceAccountType.USD_M_FUTURE_TESTNET,
+    )
+    _account_type._is_inverse = _account_type in (
+        BinanceAccountType.COIN_M_FUTURE,
+        BinanceAccountType.COIN_M_FUTURE_TESTNET,
+    )
+    _account_type._is_portfolio_margin = (
+        _account_type is BinanceAccountType.PORTFOLIO_MARGIN
+    )
+    _account_type._is_testnet = _account_type in _TESTNET
+    _account_type._is_mock = _account_type in _MOCK
 
 
 class EndpointsType(Enum):
@@ -11,6 +11,7 @@ from nexustrader.constants import (
     PositionSide,
     InstrumentType,
     ExchangeType,
+    to_exchange_type,
     SubmitType,
     AlgoOrderStatus,
     KlineInterval,
@@ -55,7 +56,7 @@ class InstrumentId(Struct):
         else:
             type = InstrumentType.SPOT
 
-        return cls(symbol=symbol, exchange=ExchangeType(exchange.lower()), type=type)
+        return cls(symbol=symbol, exchange=to_exchange_type(exchange.lower()), type=type)
 
 
 class BookL1(Struct, gc=False):
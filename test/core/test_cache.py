@@ -1,5 +1,8 @@
 import pytest
 import time
+import asyncio
+import sqlite3
+import msgspec
 from decimal import Decimal
 from copy import copy
 from nexustrader.schema import Order, ExchangeType, BookL1, Kline, Trade, Position, PositionSide, Balance
@@ -9,15 +12,17 @@ from nexustrader.exchange.binance.constants import BinanceAccountType
 
 
 @pytest.fixture
-async def async_cache(task_manager, message_bus, order_registry) -> AsyncCache: # type: ignore
+async def async_cache(task_manager, message_bus, order_registry, tmp_path) -> AsyncCache: # type: ignore
     from nexustrader.core.cache import AsyncCache
 
+    # a fresh database per test, rows left by other tests must not satisfy asserts
     cache = AsyncCache(
         strategy_id="auto-test-strategy",
         user_id="auto-test-user",
         msgbus=message_bus,
         task_manager=task_manager,
         registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
     )
     yield cache
     await cache.close()
@@ -128,6 +133,187 @@ async def test_cache_cleanup(async_cache: AsyncCache, sample_order: Order):
     assert expired_order.uuid not in async_cache._mem_orders
 
 
+async def test_cache_cleanup_keeps_refreshed_order(
+    async_cache: AsyncCache, sample_order: Order
+):
+    old_order: Order = copy(sample_order)
+    old_order.timestamp = 1
+    async_cache._order_initialized(old_order)
+
+    # a later update refreshes the timestamp the order was queued with
+    refreshed_order: Order = copy(sample_order)
+    refreshed_order.timestamp = time.time() * 1000
+    async_cache._mem_orders[refreshed_order.uuid] = refreshed_order
+    async_cache._cleanup_expired_data()
+
+    assert refreshed_order.uuid in async_cache._mem_orders
+
+
+async def test_sync_writes_only_dirty_orders(async_cache: AsyncCache, sample_order: Order):
+    await async_cache._init_storage() # init storage
+    sample_order.timestamp = int(time.time() * 1000)
+    async_cache._order_initialized(sample_order)
+    assert sample_order.uuid in async_cache._dirty_orders
+
+    await async_cache._sync_to_sqlite()
+    assert not async_cache._dirty_orders
+
+    rows = async_cache._read(
+        f"SELECT uuid FROM {async_cache._table_prefix}_orders WHERE uuid = ?",
+        (sample_order.uuid,),
+    )
+    assert rows
+
+
+async def test_sync_orders_with_huge_amount(async_cache: AsyncCache, sample_order: Order):
+    await async_cache._init_storage() # init storage
+    huge_order: Order = copy(sample_order)
+    huge_order.uuid = "huge-uuid"
+    huge_order.amount = Decimal("100000000000")
+    async_cache._order_initialized(sample_order)
+    async_cache._order_initialized(huge_order)
+
+    await async_cache._sync_to_sqlite()
+    assert not async_cache._dirty_orders
+
+    # too large for a 64-bit scaled integer, the BLOB still keeps the amount
+    rows = async_cache._read(
+        f"SELECT uuid, amount_scaled FROM {async_cache._table_prefix}_orders"
+    )
+    assert dict(rows) == {sample_order.uuid: 100000000, huge_order.uuid: None}
+    async_cache._mem_orders.clear()
+    assert async_cache._get_order_from_sqlite(huge_order.uuid).amount == huge_order.amount
+
+
+async def test_sync_drops_unwritable_rows(async_cache: AsyncCache, sample_order: Order):
+    await async_cache._init_storage() # init storage
+    bad_order: Order = copy(sample_order)
+    bad_order.uuid = "bad-uuid"
+    bad_order.price = Decimal("1")  # sqlite3 cannot bind a Decimal
+    async_cache._order_initialized(bad_order)
+    async_cache._order_initialized(sample_order)
+
+    # the bad row is dropped instead of failing, and requeueing, the batch
+    await async_cache._sync_to_sqlite()
+    assert not async_cache._dirty_orders
+
+    rows = async_cache._read(f"SELECT uuid FROM {async_cache._table_prefix}_orders")
+    assert rows == [(sample_order.uuid,)]
+
+
+async def test_failed_sync_requeues_dirty_orders(
+    async_cache: AsyncCache, sample_order: Order, monkeypatch
+):
+    await async_cache._init_storage() # init storage
+    sample_order.timestamp = int(time.time() * 1000)
+    async_cache._order_initialized(sample_order)
+
+    async def fail(cursor):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(async_cache, "_sync_balances", fail)
+    with pytest.raises(RuntimeError):
+        await async_cache._sync_to_sqlite()
+
+    # the drained order is queued again for the next sync
+    assert sample_order.uuid in async_cache._dirty_orders
+
+
+async def test_sqlite_writer_survives_failed_sync(
+    async_cache: AsyncCache, sample_order: Order, monkeypatch
+):
+    await async_cache._init_storage() # init storage
+    sample_order.timestamp = int(time.time() * 1000)
+    async_cache._order_initialized(sample_order)
+    async_cache._flush_interval = 0.01
+
+    sync_balances = async_cache._sync_balances
+    calls = []
+
+    async def fail_once(cursor):
+        calls.append(cursor)
+        if len(calls) == 1:
+            raise RuntimeError("write failed")
+        await sync_balances(cursor)
+
+    monkeypatch.setattr(async_cache, "_sync_balances", fail_once)
+    writer = asyncio.create_task(async_cache._sqlite_writer())
+    try:
+        async with asyncio.timeout(5):
+            while len(calls) < 2 or async_cache._db_async.in_transaction:
+                await asyncio.sleep(0.01)
+    finally:
+        writer.cancel()
+
+    rows = async_cache._read(
+        f"SELECT uuid FROM {async_cache._table_prefix}_orders WHERE uuid = ?",
+        (sample_order.uuid,),
+    )
+    assert rows
+
+
+async def test_init_storage_migrates_old_orders_table(
+    async_cache: AsyncCache, sample_order: Order
+):
+    # the single-table layout with JSON BLOBs written by earlier versions
+    db = sqlite3.connect(async_cache._db_path)
+    db.execute(
+        f"""
+        CREATE TABLE {async_cache._table_prefix}_orders (
+            timestamp INTEGER,
+            uuid TEXT PRIMARY KEY,
+            symbol TEXT,
+            side TEXT,
+            type TEXT,
+            amount TEXT,
+            price REAL,
+            status TEXT,
+            data BLOB
+        )
+        """
+    )
+    db.execute(
+        f"INSERT INTO {async_cache._table_prefix}_orders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            sample_order.timestamp,
+            sample_order.uuid,
+            sample_order.symbol,
+            sample_order.side.value,
+            sample_order.type.value,
+            str(sample_order.amount),
+            sample_order.price,
+            sample_order.status.value,
+            msgspec.json.encode(sample_order),
+        ),
+    )
+    # too large for a scaled 64-bit integer, must not break startup
+    db.execute(
+        f"INSERT INTO {async_cache._table_prefix}_orders (uuid, amount) VALUES (?, ?)",
+        ("huge-uuid", "100000000000"),
+    )
+    db.commit()
+    db.close()
+
+    await async_cache._init_storage()
+
+    assert async_cache._get_order_from_sqlite(sample_order.uuid) == sample_order
+    columns = {
+        row[1]
+        for row in async_cache._read(
+            f"PRAGMA table_info({async_cache._table_prefix}_orders)"
+        )
+    }
+    assert "data" not in columns
+
+    rows = async_cache._read(
+        f"SELECT uuid, amount, amount_scaled FROM {async_cache._table_prefix}_orders"
+    )
+    assert sorted(rows) == [
+        ("huge-uuid", "100000000000", None),
+        (sample_order.uuid, None, 100000000),
+    ]
+
+
 ################ # test cache private position data  ###################
 
 async def test_cache_apply_position(async_cache: AsyncCache):
@@ -168,6 +354,33 @@ async def test_cache_apply_position(async_cache: AsyncCache):
     
     assert "ETHUSDT-PERP.BINANCE" in positions
 
+async def test_cache_get_all_positions_by_exchange(async_cache: AsyncCache):
+    position = Position(
+        symbol="BTCUSDT-PERP.BINANCE",
+        exchange=ExchangeType.BINANCE,
+        signed_amount=Decimal('0.001'),
+        entry_price=10660,
+        side=PositionSide.LONG,
+        unrealized_pnl=0,
+        realized_pnl=0,
+    )
+    async_cache._apply_position(position)
+    assert position.symbol in async_cache.get_all_positions(ExchangeType.BINANCE)
+    assert not async_cache.get_all_positions(ExchangeType.OKX)
+
+    closed = Position(
+        symbol="BTCUSDT-PERP.BINANCE",
+        exchange=ExchangeType.BINANCE,
+        signed_amount=Decimal('0'),
+        entry_price=10660,
+        side=None,
+        unrealized_pnl=0,
+        realized_pnl=0,
+    )
+    async_cache._apply_position(closed)
+    assert not async_cache.get_all_positions(ExchangeType.BINANCE)
+    assert not async_cache.get_all_positions()
+
 async def test_cache_apply_balance(async_cache: AsyncCache):
     btc = Balance(
         asset="BTC",
@@ -198,4 +411,80 @@ async def test_cache_apply_balance(async_cache: AsyncCache):
             assert balance.free == usdt.free
             assert balance.locked == usdt.locked
     
-    
\ No newline at end of file
+    
+
+async def test_failed_sync_rewrites_balances(async_cache: AsyncCache, monkeypatch):
+    await async_cache._init_storage() # init storage
+    eth = Balance(
+        asset="ETH",
+        free=Decimal(str(time.time())),
+        locked=Decimal('0'),
+    )
+    async_cache._apply_balance(BinanceAccountType.SPOT, [eth])
+
+    sync_balances = async_cache._sync_balances
+
+    async def write_then_fail(cursor):
+        await sync_balances(cursor)
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(async_cache, "_sync_balances", write_then_fail)
+    with pytest.raises(RuntimeError):
+        await async_cache._sync_to_sqlite()
+    monkeypatch.setattr(async_cache, "_sync_balances", sync_balances)
+
+    # the rolled back values must not be treated as already written
+    await async_cache._sync_to_sqlite()
+    balances = async_cache._get_balance_from_sqlite(BinanceAccountType.SPOT)
+    assert any(b.asset == "ETH" and b.free == eth.free for b in balances)
+
+
+class _RecordingPipeline:
+    def __init__(self, calls: list):
+        self._calls = calls
+        self._pending = []
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self._pending.append((name, *args))
+
+        return command
+
+    async def execute(self):
+        self._calls.extend(self._pending)
+        self._pending = []
+
+
+class _RecordingRedis:
+    def __init__(self):
+        self.calls = []
+
+    def pipeline(self, transaction: bool = True):
+        return _RecordingPipeline(self.calls)
+
+
+async def test_redis_sync_removes_closed_positions(async_cache: AsyncCache):
+    async_cache._r_async = _RecordingRedis()
+    symbol = "BTCUSDT-PERP.BINANCE"
+    position = Position(
+        symbol=symbol,
+        exchange=ExchangeType.BINANCE,
+        signed_amount=Decimal('0.001'),
+        entry_price=10660,
+        side=PositionSide.LONG,
+    )
+    async_cache._apply_position(position)
+    await async_cache._sync_to_redis()
+    async_cache._apply_position(
+        Position(symbol=symbol, exchange=ExchangeType.BINANCE)
+    )
+    await async_cache._sync_to_redis()
+
+    prefix = async_cache._keys.exchange["binance"]
+    calls = async_cache._r_async.calls
+    assert ("delete", f"{prefix}symbol_positions:{symbol}") in calls
+    assert ("srem", f"{prefix}position_index", symbol) in calls
+    assert not async_cache._deleted_position_symbols
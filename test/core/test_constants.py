@@ -0,0 +1,237 @@
+import pytest
+import os
+from nexustrader import constants
+from nexustrader.constants import _LazySettings
+
+
+@pytest.fixture
+def settings_dir(tmp_path, monkeypatch):
+    keys = tmp_path / ".keys"
+    keys.mkdir()
+    (keys / "settings.toml").write_text("")
+    (keys / ".secrets.toml").write_text(
+        'REDIS_HOST = "localhost"\nREDIS_PORT = 6379\nREDIS_DB = 0\n'
+        'REDIS_PASSWORD = ""\n[OKX.DEMO_1]\nAPI_KEY = "k"\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(constants, "SETTINGS_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path
+
+
+def test_lazy_settings_contains(settings_dir):
+    settings = _LazySettings()
+
+    assert "REDIS_HOST" in settings
+    assert "redis_host" in settings
+    assert "MISSING_KEY" not in settings
+
+
+def test_cached_settings_match_dynaconf(settings_dir):
+    cold = _LazySettings()
+    cold._load()
+    warm = _LazySettings()
+    assert isinstance(warm._load(), constants._SettingsDict)
+
+    for settings in (cold, warm):
+        assert settings.get("OKX.DEMO_1.API_KEY") == "k"
+        assert settings.get("okx.demo_1.api_key") == "k"
+        assert settings["OKX.DEMO_1.API_KEY"] == "k"
+        assert settings.OKX.DEMO_1.api_key == "k"
+        assert settings.get("OKX.MISSING.API_KEY", "default") == "default"
+        assert "OKX.DEMO_1" in settings
+
+
+def test_settings_cache_drops_stale_files(settings_dir):
+    _LazySettings()._load()
+    (settings_dir / ".keys" / ".secrets.toml").write_text('REDIS_HOST = "changed"\n')
+    _LazySettings()._load()
+
+    cached = list((settings_dir / "cache").glob("settings-*.pkl"))
+    assert len(cached) == 1
+
+
+def test_settings_cache_keeps_other_directories(settings_dir, monkeypatch):
+    _LazySettings()._load()
+    other = settings_dir / "other"
+    (other / ".keys").mkdir(parents=True)
+    for name in ("settings.toml", ".secrets.toml"):
+        (other / ".keys" / name).write_text(
+            (settings_dir / ".keys" / name).read_text()
+        )
+    monkeypatch.chdir(other)
+    _LazySettings()._load()
+
+    cached = list((settings_dir / "cache").glob("settings-*.pkl"))
+    assert len(cached) == 2
+
+
+def test_cached_settings_keep_dynaconf_api(settings_dir):
+    _LazySettings()._load()
+    warm = _LazySettings()
+    assert isinstance(warm._load(), constants._SettingsDict)
+
+    # Dynaconf methods are not cached, the proxy falls back to Dynaconf
+    assert warm.exists("OKX.DEMO_1.API_KEY")
+    assert warm.get("OKX.DEMO_1.API_KEY") == "k"
+
+
+def test_redis_config_reads_dotenv(settings_dir, monkeypatch):
+    (settings_dir / ".env").write_text("NEXUS_REDIS_HOST=fromenvfile\n")
+    monkeypatch.setattr(constants, "settings", _LazySettings())
+    constants._raw_secrets.cache_clear()
+    constants.get_redis_config.cache_clear()
+    try:
+        assert constants.get_redis_config()["host"] == "fromenvfile"
+    finally:
+        os.environ.pop("NEXUS_REDIS_HOST", None)
+        constants._raw_secrets.cache_clear()
+        constants.get_redis_config.cache_clear()
+
+
+def test_redis_config_call_forms_share_cache(settings_dir, monkeypatch):
+    monkeypatch.setattr(constants, "settings", _LazySettings())
+    constants._raw_secrets.cache_clear()
+    constants.get_redis_config.cache_clear()
+    try:
+        config = constants.get_redis_config()
+        assert constants.get_redis_config(False) is config
+        assert constants.get_redis_config(in_docker=False) is config
+        assert constants._redis_config.cache_info().misses == 1
+    finally:
+        constants._raw_secrets.cache_clear()
+        constants.get_redis_config.cache_clear()
+
+
+def test_redis_pool_call_forms_share_pool(settings_dir, monkeypatch):
+    monkeypatch.setattr(constants, "settings", _LazySettings())
+    constants._raw_secrets.cache_clear()
+    constants.get_redis_config.cache_clear()
+    constants._redis_pool.cache_clear()
+    try:
+        pool = constants.get_redis_pool()
+        assert constants.get_redis_pool(False) is pool
+        assert constants.get_redis_pool(in_docker=False) is pool
+    finally:
+        constants._raw_secrets.cache_clear()
+        constants.get_redis_config.cache_clear()
+        constants._redis_pool.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "parse, enum_cls",
+    [
+        (constants.to_order_status, constants.OrderStatus),
+        (constants.to_exchange_type, constants.ExchangeType),
+        (constants.to_order_side, constants.OrderSide),
+    ],
+)
+def test_enum_parsers_match_enum_call(parse, enum_cls):
+    for member in enum_cls:
+        assert parse(member.value) is enum_cls(member.value)
+
+    with pytest.raises(ValueError) as expected:
+        enum_cls("foo")
+    with pytest.raises(ValueError) as raised:
+        parse("foo")
+    assert str(raised.value) == str(expected.value)
+
+
+# STATUS_TRANSITIONS as originally written with lists, the frozenset and
+# bitmask forms must accept exactly the same pairs
+_S = constants.OrderStatus
+_ORIGINAL_TRANSITIONS = {
+    _S.PENDING: [
+        _S.CANCELED, _S.CANCELING, _S.ACCEPTED, _S.PARTIALLY_FILLED,
+        _S.FILLED, _S.CANCEL_FAILED,
+    ],
+    _S.CANCELING: [_S.CANCELED, _S.PARTIALLY_FILLED, _S.FILLED],
+    _S.ACCEPTED: [
+        _S.PARTIALLY_FILLED, _S.FILLED, _S.CANCELING, _S.CANCELED,
+        _S.EXPIRED, _S.CANCEL_FAILED,
+    ],
+    _S.PARTIALLY_FILLED: [
+        _S.PARTIALLY_FILLED, _S.FILLED, _S.CANCELING, _S.CANCELED,
+        _S.EXPIRED, _S.CANCEL_FAILED,
+    ],
+    _S.FILLED: [],
+    _S.CANCELED: [],
+    _S.EXPIRED: [],
+    _S.FAILED: [],
+}
+
+
+def test_can_transition_matches_status_transitions():
+    assert {k: set(v) for k, v in constants.STATUS_TRANSITIONS.items()} == {
+        k: set(v) for k, v in _ORIGINAL_TRANSITIONS.items()
+    }
+    for cur in _S:
+        for nxt in _S:
+            expected = nxt in _ORIGINAL_TRANSITIONS.get(cur, ())
+            assert constants.can_transition(cur, nxt) == expected, (cur, nxt)
+
+
+def test_enum_predicates_match_original_definitions():
+    T = constants.OrderType
+    for member in T:
+        assert member.is_take_profit == (member in (T.TAKE_PROFIT_MARKET, T.TAKE_PROFIT_LIMIT))
+        assert member.is_stop_loss == (member in (T.STOP_LOSS_MARKET, T.STOP_LOSS_LIMIT))
+        assert member.is_market == (
+            member in (T.MARKET, T.TAKE_PROFIT_MARKET, T.STOP_LOSS_MARKET)
+        )
+        assert member.is_limit == (
+            member in (T.LIMIT, T.TAKE_PROFIT_LIMIT, T.STOP_LOSS_LIMIT)
+        )
+
+    for member in constants.OrderSide:
+        assert member.is_buy == (member == constants.OrderSide.BUY)
+        assert member.is_sell == (member == constants.OrderSide.SELL)
+
+    P = constants.PositionSide
+    for member in P:
+        assert member.is_long == (member == P.LONG)
+        assert member.is_short == (member == P.SHORT)
+        assert member.is_flat == (member == P.FLAT)
+
+
+def test_binance_account_type_predicates_match_original_definitions():
+    from nexustrader.exchange.binance.constants import BinanceAccountType as B
+
+    original = {
+        "is_spot": (B.SPOT, B.SPOT_TESTNET),
+        "is_margin": (B.MARGIN,),
+        "is_isolated_margin": (B.ISOLATED_MARGIN,),
+        "is_isolated_margin_or_margin": (B.MARGIN, B.ISOLATED_MARGIN),
+        "is_spot_or_margin": (B.SPOT, B.MARGIN, B.ISOLATED_MARGIN, B.SPOT_TESTNET),
+        "is_future": (
+            B.USD_M_FUTURE,
+            B.COIN_M_FUTURE,
+            B.USD_M_FUTURE_TESTNET,
+            B.COIN_M_FUTURE_TESTNET,
+        ),
+        "is_linear": (B.USD_M_FUTURE, B.USD_M_FUTURE_TESTNET),
+        "is_inverse": (B.COIN_M_FUTURE, B.COIN_M_FUTURE_TESTNET),
+        "is_portfolio_margin": (B.PORTFOLIO_MARGIN,),
+        "is_testnet": (B.SPOT_TESTNET, B.USD_M_FUTURE_TESTNET, B.COIN_M_FUTURE_TESTNET),
+        "is_mock": (B.LINEAR_MOCK, B.INVERSE_MOCK, B.SPOT_MOCK),
+        "is_linear_mock": (B.LINEAR_MOCK,),
+        "is_inverse_mock": (B.INVERSE_MOCK,),
+        "is_spot_mock": (B.SPOT_MOCK,),
+    }
+    for member in B:
+        for name, members in original.items():
+            assert getattr(member, name) == (member in members), (member, name)
+
+
+def test_can_transition_from_validators():
+    for cur, allowed in _ORIGINAL_TRANSITIONS.items():
+        validator = getattr(constants, f"can_transition_from_{cur.name.lower()}")
+        for nxt in _S:
+            assert validator(nxt) == (nxt in allowed), (cur, nxt)
+
+    # only statuses with an entry in the table get a validator
+    generated = {
+        name for name in dir(constants) if name.startswith("can_transition_from_")
+    }
+    assert generated == {
+        f"can_transition_from_{cur.name.lower()}" for cur in _ORIGINAL_TRANSITIONS
+    }
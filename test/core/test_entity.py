@@ -38,3 +38,88 @@ async def test_task_cancellation(task_manager: TaskManager) -> None:
 
     # assert not task_manager._tasks
     # assert task.done()
+
+
+class _FakePipeline:
+    def __init__(self, executed: list, fail: bool = False):
+        self._executed = executed
+        self._fail = fail
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def execute_command(self, *args):
+        self._commands.append(args)
+
+    async def execute(self):
+        if self._fail:
+            raise ConnectionError("redis unavailable")
+        self._executed.append(self._commands)
+
+
+class _FakeRedis:
+    def __init__(self, failures: int = 0):
+        self.executed = []
+        self.failures = failures
+
+    def pipeline(self, transaction: bool = True):
+        fail = self.failures > 0
+        self.failures -= fail
+        return _FakePipeline(self.executed, fail)
+
+
+@pytest.mark.asyncio
+async def test_redis_batcher_flushes_in_batches(task_manager: TaskManager) -> None:
+    from nexustrader.core.entity import RedisBatcher
+
+    client = _FakeRedis()
+    batcher = RedisBatcher(client, task_manager, max_batch=2, max_delay_ms=5)
+    batcher.start()
+
+    for i in range(3):
+        batcher.submit("SET", f"key-{i}", i)
+    await asyncio.sleep(0.05)
+
+    assert [len(batch) for batch in client.executed] == [2, 1]
+    assert client.executed[0][0] == ("SET", "key-0", 0)
+    await task_manager.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redis_batcher_retries_failed_batch(task_manager: TaskManager) -> None:
+    from nexustrader.core.entity import RedisBatcher
+
+    client = _FakeRedis(failures=1)
+    batcher = RedisBatcher(
+        client, task_manager, max_batch=2, max_delay_ms=5, retry_delay_ms=5
+    )
+    batcher.start()
+
+    for i in range(10):
+        batcher.submit("SET", f"key-{i}", i)
+    await asyncio.sleep(0.1)
+
+    flushed = [args for batch in client.executed for args in batch]
+    assert flushed == [("SET", f"key-{i}", i) for i in range(10)]
+    assert not batcher._pending
+    await task_manager.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redis_batcher_close_flushes_pending(task_manager: TaskManager) -> None:
+    from nexustrader.core.entity import RedisBatcher
+
+    client = _FakeRedis()
+    batcher = RedisBatcher(client, task_manager, max_batch=100, max_delay_ms=1000)
+    batcher.start()
+
+    for i in range(3):
+        batcher.submit("SET", f"key-{i}", i)
+    await batcher.close()
+
+    assert [len(batch) for batch in client.executed] == [3]
+    assert not batcher._pending